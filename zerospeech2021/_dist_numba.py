@@ -0,0 +1,49 @@
+"""Numba compiled distance kernels for the semantic evaluation
+
+Importing this module requires numba; callers must treat it as an
+optional dependency and fall back on scipy when the import fails.
+
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def cdist_euclidean(A, B):
+    """Pairwise euclidean distances between the rows of A and B"""
+    out = np.empty((A.shape[0], B.shape[0]))
+    for i in prange(A.shape[0]):
+        for j in range(B.shape[0]):
+            total = 0.0
+            for k in range(A.shape[1]):
+                diff = A[i, k] - B[j, k]
+                total += diff * diff
+            out[i, j] = np.sqrt(total)
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def cdist_cosine(A, B):
+    """Pairwise cosine distances between the rows of A and B"""
+    norms_a = np.empty(A.shape[0])
+    for i in range(A.shape[0]):
+        norms_a[i] = np.sqrt(np.sum(A[i] ** 2))
+    norms_b = np.empty(B.shape[0])
+    for j in range(B.shape[0]):
+        norms_b[j] = np.sqrt(np.sum(B[j] ** 2))
+
+    out = np.empty((A.shape[0], B.shape[0]))
+    for i in prange(A.shape[0]):
+        for j in range(B.shape[0]):
+            dot = 0.0
+            for k in range(A.shape[1]):
+                dot += A[i, k] * B[j, k]
+            out[i, j] = 1.0 - dot / (norms_a[i] * norms_b[j])
+    return out
+
+
+# pay the JIT compilation cost once at import time
+_dummy = np.ones((1, 1))
+cdist_euclidean(_dummy, _dummy)
+cdist_cosine(_dummy, _dummy)
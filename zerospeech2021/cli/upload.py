@@ -7,7 +7,8 @@ import click
 from rich.console import Console
 from rich.progress import Progress, BarColumn
 
-from zerospeech2021 import zr_upload_lib as zr_up
+# zr_upload_lib is imported inside the commands: it drags in the
+# requests/upload machinery which is useless for --help and error paths
 
 # Fancy console
 console = Console()
@@ -30,6 +31,8 @@ def upload_cmd(ctx, debug):
 @click.option('--clear', is_flag=True)
 @click.pass_obj
 def login(debug, username, password, clear):
+    from zerospeech2021 import zr_upload_lib as zr_up
+
     # clear session
     if clear:
         zr_up.auth.clear_session()
@@ -53,6 +56,8 @@ def login(debug, username, password, clear):
 @click.pass_obj
 def multipart(debug, archive_file):
     """ Upload an archive using multipart upload """
+    from zerospeech2021 import zr_upload_lib as zr_up
+
     if archive_file.is_file() and archive_file.suffix != ".zip":
         console.print(f"ERROR: given file: {archive_file} was not found or is not a .zip file !!",
                       style="red bold")
@@ -85,6 +90,8 @@ def multipart(debug, archive_file):
 @click.pass_obj
 def simple(debug, archive_file):
     """ Upload an archive using simple upload """
+    from zerospeech2021 import zr_upload_lib as zr_up
+
     if archive_file.is_file() and archive_file.suffix != ".zip":
         console.print(f"ERROR: given file: {archive_file} was not found or is not a .zip file !!",
                       style="red bold")
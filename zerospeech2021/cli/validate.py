@@ -6,11 +6,14 @@ import shutil
 import sys
 import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import click
 
-from zerospeech2021 import (
-    exception, meta, phonetic, lexical, syntactic, semantic)
+# the per-task validators are imported lazily inside each _validate_*
+# function: they pull in the numpy/pandas/scipy stack and there is no
+# point paying that import cost for tasks the user skipped
+from zerospeech2021 import exception, meta
 
 
 def _validate_directory(directory, expected):
@@ -26,6 +29,8 @@ def _validate_directory(directory, expected):
 
 
 def _validate_phonetic(submission, dataset, only_dev, njobs):
+    from zerospeech2021 import phonetic
+
     print('Validating phonetic...')
     _validate_directory(
         submission / 'phonetic',
@@ -47,6 +52,8 @@ def _validate_phonetic(submission, dataset, only_dev, njobs):
 
 
 def _validate_lexical(submission, dataset, only_dev):
+    from zerospeech2021 import lexical
+
     print('Validating lexical...')
     _validate_directory(
         submission / 'lexical',
@@ -65,6 +72,8 @@ def _validate_lexical(submission, dataset, only_dev):
 
 
 def _validate_syntactic(submission, dataset, only_dev):
+    from zerospeech2021 import syntactic
+
     print('Validating syntactic...')
     _validate_directory(
         submission / 'syntactic',
@@ -83,6 +92,8 @@ def _validate_syntactic(submission, dataset, only_dev):
 
 
 def _validate_semantic(submission, dataset, only_dev, njobs):
+    from zerospeech2021 import semantic
+
     print('Validating semantic...')
     semantic_content = ['dev'] if only_dev else ['dev', 'test']
     _validate_directory(submission / 'semantic', semantic_content)
@@ -110,6 +121,24 @@ def _validate_semantic(submission, dataset, only_dev, njobs):
             submission / 'semantic', dataset, 'test', 'librispeech', njobs=njobs)
 
 
+def _validate_task(task, submission, dataset, only_dev, njobs):
+    """Runs a single task validation, from a worker process"""
+    try:
+        if task == 'phonetic':
+            _validate_phonetic(submission, dataset, only_dev, njobs)
+        elif task == 'lexical':
+            _validate_lexical(submission, dataset, only_dev)
+        elif task == 'syntactic':
+            _validate_syntactic(submission, dataset, only_dev)
+        else:  # semantic
+            _validate_semantic(submission, dataset, only_dev, njobs)
+    except exception.ValidationError as error:
+        # some ValidationError subclasses take extra constructor arguments
+        # and do not survive the pickle trip back to the parent process, so
+        # forward the rendered message as the base class
+        raise exception.ValidationError(str(error)) from None
+
+
 @click.command(epilog='See https://zerospeech.com/2021 for more details')
 @click.argument('dataset', type=pathlib.Path)
 @click.argument('submission', type=pathlib.Path)
@@ -182,17 +211,20 @@ def validate(
             print('  > code folder detected: submission will be manually '
                   'inspected to ensure it is open source')
 
-        if not no_phonetic:
-            _validate_phonetic(submission, dataset, only_dev, njobs)
-
-        if not no_lexical:
-            _validate_lexical(submission, dataset, only_dev)
-
-        if not no_syntactic:
-            _validate_syntactic(submission, dataset, only_dev)
-
-        if not no_semantic:
-            _validate_semantic(submission, dataset, only_dev, njobs)
+        # the four tasks read disjoint files and share no state: validate
+        # them concurrently so the wall time is the slowest task, not the sum
+        tasks = [
+            task for task, skip in [
+                ('phonetic', no_phonetic), ('lexical', no_lexical),
+                ('syntactic', no_syntactic), ('semantic', no_semantic)]
+            if not skip]
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(
+                    _validate_task, task, submission, dataset, only_dev, njobs)
+                for task in tasks]
+            for future in as_completed(futures):
+                future.result()
 
     except (exception.ValidationError, ValueError, FileNotFoundError) as error:
         print(f'ERROR: {error}')
@@ -4,6 +4,7 @@ import collections
 import pathlib
 import sys
 
+import numpy as np
 import pandas
 from zerospeech2021.exception import FormatError, MismatchError
 
@@ -194,9 +195,11 @@ def evaluate_by_pair(data):
     # compute the score for each pair in an additional 'score' column, then
     # delete the 'score word' and 'score non word' columns that become useless
     score = data.loc[:, ['score word', 'score non word']].to_numpy()
-    data['score'] = (
-        0.5 * (score[:, 0] == score[:, 1])
-        + (score[:, 0] > score[:, 1]))
+    word, non_word = score[:, 0], score[:, 1]
+    result = np.empty(len(score))
+    np.greater(word, non_word, out=result)  # 1.0 or 0.0, no temporary
+    result += 0.5 * (word == non_word)
+    data['score'] = result
     data.drop(columns=['score word', 'score non word'], inplace=True)
 
     # finally get the mean score across voices for all pairs
@@ -7,6 +7,11 @@ import yaml
 
 from zerospeech2021.exception import ValidationError, MismatchError
 
+try:  # prefer the libyaml C parser when pyyaml is built with it
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:  # pragma: nocover
+    _YamlLoader = yaml.SafeLoader
+
 
 def _validate_entries(meta, entries, prefix=None):
     if sorted(meta.keys()) != sorted(entries.keys()):
@@ -81,7 +86,9 @@ def validate(submission):
         raise ValidationError("missing meta.yaml file")
 
     try:
-        meta = yaml.safe_load(meta_file.open('r').read().replace('\t', ' '))
+        meta = yaml.load(
+            meta_file.open('r').read().replace('\t', ' '),
+            Loader=_YamlLoader)
     except yaml.YAMLError as err:
         raise ValidationError(f'failed to parse {meta_file}: {err}')
 
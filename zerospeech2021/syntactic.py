@@ -4,6 +4,7 @@ import collections
 import pathlib
 import sys
 
+import numpy as np
 import pandas
 from zerospeech2021.exception import FormatError, MismatchError
 
@@ -80,10 +81,26 @@ def validate(submission, dataset, kind):
         raise ValueError(f'dataset not found: {dataset}')
     required_files = set(w.stem for w in dataset.glob('*.wav'))
 
-    # ensure each line in the submission is valid and retrieve the filenames
-    submitted_files = list(
-        _validate_line(index + 1, line)
-        for index, line in enumerate(open(submission, 'r')))
+    # ensure each line in the submission is valid and retrieve the
+    # filenames: bulk parse with the pandas C engine, falling back on the
+    # per-line validation to report the exact faulty line on any anomaly
+    try:
+        data = pandas.read_csv(
+            submission, sep=' ', header=None, names=['filename', 'score'],
+            dtype=str, skip_blank_lines=False, engine='c')
+        is_valid = not (
+            data['filename'].isna() | data['score'].isna()
+            | pandas.to_numeric(data['score'], errors='coerce').isna()).any()
+    except (pandas.errors.ParserError, pandas.errors.EmptyDataError):
+        is_valid = False
+
+    if is_valid:
+        submitted_files = data['filename'].tolist()
+    else:
+        with open(submission, 'r') as lines:
+            submitted_files = [
+                _validate_line(index + 1, line)
+                for index, line in enumerate(lines)]
 
     # ensures the is no duplicate in the filenames
     duplicates = [
@@ -198,21 +215,22 @@ def evaluate_by_pair(data):
     # compute the score for each pair in an additional 'score' column, then
     # delete the 'score word' and 'score non word' columns that become useless
     score = data.loc[:, ['score sentence', 'score non sentence']].to_numpy()
-    data['score'] = (
-        0.5 * (score[:, 0] == score[:, 1])
-        + (score[:, 0] > score[:, 1]))
+    sentence, non_sentence = score[:, 0], score[:, 1]
+    result = np.empty(len(score))
+    np.greater(sentence, non_sentence, out=result)  # 1.0 or 0.0, no temporary
+    result += 0.5 * (sentence == non_sentence)
+    data['score'] = result
     data.drop(columns=['score sentence', 'score non sentence'], inplace=True)
 
-    # finally get the mean score across voices for all pairs
-    score = data.groupby(['type', 'subtype', 'id']).apply(lambda x: (
-        x.iat[0, 2],  # type
-        x.iat[0, 3],  # subtype
-        x.iat[0, 4],  # sentence
-        x.iat[0, 5],  # non sentence
-        x['score'].mean()))
-    return pandas.DataFrame(
-        score.to_list(),
-        columns=['type', 'subtype', 'sentence', 'non sentence', 'score'])
+    # finally get the mean score across voices for all pairs: vectorized
+    # per-group means on one side, the per-pair constant columns
+    # de-duplicated on the other, no per-group Python dispatch
+    means = data.groupby(
+        ['type', 'subtype', 'id'], as_index=False)['score'].mean()
+    sentences = data.drop_duplicates(['type', 'subtype', 'id'])[
+        ['type', 'subtype', 'id', 'sentence', 'non sentence']]
+    return means.merge(sentences, on=['type', 'subtype', 'id'])[
+        ['type', 'subtype', 'sentence', 'non sentence', 'score']]
 
 
 def evaluate_by_type(by_pair):
@@ -1,6 +1,5 @@
 from pathlib import Path
 
-import requests
 
 from rich.console import Console
 from rich.table import Table
@@ -13,7 +12,7 @@ console = Console()
 
 def view_challenges():
     """ Fetches the list of available challenges and allows selecting one."""
-    response = requests.get(
+    response = model.SESSION.get(
         f"{model.SERVER_LOCATION}/challenges/", params={"include_inactive": "false"})
     if response.status_code != 200:
         raise ValueError('Request to server Failed !!')
@@ -39,7 +38,7 @@ def create_multipart_submission(challenge_id: int, file_meta: dict, _token: str)
         "index": file_meta['index']
     }
 
-    return requests.post(
+    return model.SESSION.post(
         f'{model.SERVER_LOCATION}/challenges/{challenge_id}/submission/create',
         json=data,
         headers={
@@ -49,7 +48,7 @@ def create_multipart_submission(challenge_id: int, file_meta: dict, _token: str)
 
 def create_single_part_submission(challenge_id: int, filename: Path, _hash: str, _token: str):
     """ Create a single part submission upload session on the server via the API."""
-    return requests.post(
+    return model.SESSION.post(
         f'{model.SERVER_LOCATION}/challenges/{challenge_id}/submission/create',
         json={
             "filename": f"{filename}",
@@ -63,15 +62,17 @@ def create_single_part_submission(challenge_id: int, filename: Path, _hash: str,
 
 def submission_upload(challenge_id: int, submission_id: str, file: Path, _token: str):
     """Upload a file (or part) to an existing upload session."""
-    response = requests.put(
-        f'{model.SERVER_LOCATION}/challenges/{challenge_id}/submission/upload',
-        params={
-            "part_name": file.name,
-            "submission_id": f"{submission_id}"
-        },
-        files={f'file_data': file.open('rb').read()},
-        headers={
-            'Authorization': f'Bearer {_token}'
-        }
-    )
-    return response
+    # pass the open handle to requests so the part is streamed from the
+    # page cache instead of being materialized as a bytes object first
+    with file.open('rb') as handler:
+        return model.SESSION.put(
+            f'{model.SERVER_LOCATION}/challenges/{challenge_id}/submission/upload',
+            params={
+                "part_name": file.name,
+                "submission_id": f"{submission_id}"
+            },
+            files={'file_data': (file.name, handler, 'application/octet-stream')},
+            headers={
+                'Authorization': f'Bearer {_token}'
+            }
+        )
@@ -1,7 +1,6 @@
 import sys
 from pathlib import Path
 
-import requests
 from rich.console import Console
 
 from . import model
@@ -9,6 +8,10 @@ from . import model
 # Fancy console
 console = Console()
 
+# resolved once: every auth check otherwise re-pays the expanduser and
+# realpath syscalls
+_AUTH_PATH = Path(model.AUTH_FILE).expanduser()
+
 
 def login(username: str, password: str):
     """ Create an auth session in zerospeech.com
@@ -17,7 +20,7 @@ def login(username: str, password: str):
     """
 
     # request login from server
-    response = requests.post(
+    response = model.SESSION.post(
         f'{model.SERVER_LOCATION}/auth/login',
         data={
             "grant_type": "password",
@@ -37,7 +40,7 @@ def login(username: str, password: str):
 
 def logout(_token):
     """ Clears the given auth session on the back-end """
-    return requests.delete(
+    return model.SESSION.delete(
         f'{model.SERVER_LOCATION}/auth/logout',
         headers={
             'Authorization': f'Bearer {_token}'
@@ -46,10 +49,9 @@ def logout(_token):
 
 def clear_session():
     """ Clear the current session locally and on the server."""
-    token_file = Path(model.AUTH_FILE).expanduser().resolve()
+    token_file = _AUTH_PATH
     if token_file.is_file():
-        with token_file.open() as fp:
-            token = fp.read().replace("\n", "")
+        token = token_file.read_text().replace("\n", "")
 
         # clear
         token_file.unlink(missing_ok=True)
@@ -59,19 +61,15 @@ def clear_session():
 
 def create_session(token: str):
     """ Creates an new auth session & saves it locally """
-    token_file = Path(model.AUTH_FILE).expanduser().resolve()
-
-    with token_file.open('w') as fp:
-        fp.write(token)
+    _AUTH_PATH.write_text(token)
 
 
 def get_session():
     """ Get or Create a new auth session """
-    token_file = Path(model.AUTH_FILE).expanduser().resolve()
+    token_file = _AUTH_PATH
 
     if not token_file.is_file():
         console.print(f"No session found use login command to create one.", style='red  bold')
         sys.exit(1)
 
-    with token_file.open() as fp:
-        return fp.read().replace("\n", "")
+    return token_file.read_text().replace("\n", "")
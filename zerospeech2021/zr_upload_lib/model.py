@@ -1,9 +1,19 @@
 import json
 import os
-from dataclasses import dataclass
+import re
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional, List
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # C encoder, several times faster on large manifests
+except ImportError:
+    orjson = None
+
 SERVER_LOCATION: str = "https://api.zerospeech.com"
 CLIENT_ID: str = "cli_uploader"
 CLIENT_SECRET: str = 'TaX9K1WtryizOTr5pLUM4OoqXZE5QGlj3Xo6dkh3CcI='
@@ -12,6 +22,14 @@ MULTIPART_THRESHOLD: int = 500000000  # in bytes (500MB)
 AUTH_FILE: str = "~/.zerospeech-token"
 CHALLENGE_ID = 7
 
+# a single session shared by all API calls: reuses the TCP/TLS connection
+# across the many requests of a multipart upload instead of a new
+# handshake per call
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8, pool_maxsize=8,
+    max_retries=Retry(total=NB_RETRY_ATTEMPTS, backoff_factor=0.3)))
+
 
 def get_challenge_id():
     """ Get the current challenge id from the current environment or return the default. """
@@ -22,6 +40,10 @@ class ZrApiException(Exception):
     pass
 
 
+# retry statuses are 'retry_<attempt>'
+_RETRY_RE = re.compile(r'retry_(\d+)')
+
+
 @dataclass
 class ManifestFileIndexItem:
     """ Upload File Manifest Item """
@@ -30,7 +52,7 @@ class ManifestFileIndexItem:
     file_hash: Optional[str] = None
 
     def dict(self):
-        return {f"{x}": getattr(self, x) for x in self.__dataclass_fields__.keys()}
+        return asdict(self)
 
     @classmethod
     def from_dict(cls, data):
@@ -49,12 +71,10 @@ class SplitManifest:
     completed: int = 0
 
     def dict(self):
-        data = {f"{x}": f"{getattr(self, x)}" for x in self.__dataclass_fields__.keys()}
-        if "index" in data.keys():
-            data["index"] = [
-                item.dict() for item in self.index
-            ]
-
+        # asdict recurses into the index items in a single C-level walk,
+        # and unlike the old f-string coercion keeps ints/bools round-trippable
+        data = asdict(self)
+        data["tmp_location"] = f"{self.tmp_location}"  # Path is not JSON safe
         return data
 
     @classmethod
@@ -71,8 +91,8 @@ class UploadManifest:
 
     @classmethod
     def load(cls, filename: Path, retries: int = 2):
-        with filename.open('r') as fp:
-            dd = json.load(fp)
+        raw = filename.read_bytes()
+        dd = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return cls(dd["manifest"], filename, metadata=dd["metadata"], retries=retries)
 
     def __init__(self, list_manifest, save_file: Path, metadata=None, retries: int = 2):
@@ -85,6 +105,15 @@ class UploadManifest:
             }
         self.save_file = save_file
         self.retries = retries
+        self._dirty_count = 0
+        # status buckets mirroring self.man: the upload loop asks "what is
+        # next" per part, and scanning the whole manifest each time is
+        # quadratic over an upload
+        self._todo = {k for k, v in self.man.items() if v == 'todo'}
+        self._waiting = {k for k, v in self.man.items() if v == 'waiting'}
+        self._retry = {k for k, v in self.man.items()
+                       if v.startswith('retry_')}
+        self._failed = {k for k, v in self.man.items() if v == 'failed'}
         if metadata:
             self._metadata = metadata
         else:
@@ -104,15 +133,9 @@ class UploadManifest:
         self.save()
 
     def __next__(self):
-        for k, v in self.man.items():
-            if v == 'todo':
-                return k
-        for k, v in self.man.items():
-            if v == 'waiting':
-                return k
-        for k, v in self.man.items():
-            if 'retry' in v:
-                return k
+        for bucket in (self._todo, self._waiting, self._retry):
+            if bucket:
+                return next(iter(bucket))
         raise StopIteration
 
     def status(self, key):
@@ -121,41 +144,69 @@ class UploadManifest:
     def set_waiting(self, key):
         if self.man[key] == 'todo':
             self.man[key] = "waiting"
-            self.save()
+            self._todo.discard(key)
+            self._waiting.add(key)
+            self._maybe_save()
 
     def set_done(self, key):
         self.man[key] = "done"
-        self.save()
+        self._todo.discard(key)
+        self._waiting.discard(key)
+        self._retry.discard(key)
+        # a completed part must survive a crash: checkpoint right away
+        self._maybe_save(force=True)
 
     def set_failed(self, key):
         k = self.man[key]
         if k in ["waiting", "todo"]:
             self.man[key] = "retry_1"
-        elif "retry" in k:
-            nb = int(k.split('_')[1])
+            self._todo.discard(key)
+            self._waiting.discard(key)
+            self._retry.add(key)
+        elif k.startswith('retry_'):
+            nb = int(_RETRY_RE.match(k).group(1))
             nb += 1
             if nb > self.retries:
                 st = 'failed'
+                self._retry.discard(key)
+                self._failed.add(key)
             else:
                 st = f"retry_{nb}"
             self.man[key] = st
-        self.save()
+        self._maybe_save()
+
+    def _maybe_save(self, force: bool = False):
+        """ Checkpoint only every few transitions to limit write amplification """
+        self._dirty_count += 1
+        if force or self._dirty_count >= 8:
+            self.save()
 
     def save(self):
-        with self.save_file.open('w') as fp:
-            json.dump({
-                "manifest": self.man,
-                "metadata": self.metadata
-            }, fp)
+        # write to a temp file then rename, so a crash mid-write can
+        # never leave a truncated checkpoint behind
+        tmp = self.save_file.with_suffix('.tmp')
+        payload = {
+            "manifest": self.man,
+            "metadata": self.metadata
+        }
+        if orjson is not None:
+            tmp.write_bytes(orjson.dumps(payload))
+        else:
+            tmp.write_text(json.dumps(payload, separators=(',', ':')))
+        os.replace(tmp, self.save_file)
+        self._dirty_count = 0
+
+    def flush(self):
+        """ Force any pending state transitions to disk """
+        if self._dirty_count:
+            self.save()
 
     def is_complete(self):
-        for k, v in self.man.items():
-            if v != "done":
-                return False
-        return True
+        return not (self._todo or self._waiting or self._retry
+                    or self._failed)
 
     def get_failed(self):
-        return [k for k, v in self.man.items() if v == 'failed']
+        return list(self._failed)
 
     def clear(self):
         # remove checkpoint file
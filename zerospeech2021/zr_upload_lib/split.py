@@ -1,26 +1,39 @@
+import hashlib
+import mmap
 import tempfile
 from pathlib import Path
 from typing import List
 
-import pandas as pd
-from Crypto.Hash import MD5
-from fsplit.filesplit import Filesplit
-
 from .model import SplitManifest, ManifestFileIndexItem
 
 
-def md5sum(file_path: Path, chunk_size: int = 8192):
+def md5sum(file_path: Path, chunk_size: int = 1 << 20):
     """ Return a md5 hash of a files content """
-    h = MD5.new()
-
     with file_path.open('rb') as f:
+        # feed large files to the hasher as a single memory-mapped buffer:
+        # no read syscalls nor copies, the kernel readahead does the I/O
+        if file_path.stat().st_size >= 1 << 20:
+            try:
+                with mmap.mmap(f.fileno(), 0,
+                               access=mmap.ACCESS_READ) as buffer:
+                    if hasattr(buffer, 'madvise'):
+                        buffer.madvise(mmap.MADV_SEQUENTIAL)
+                    h = hashlib.md5()
+                    h.update(buffer)
+                    return h.hexdigest()
+            except (ValueError, OSError):  # mmap not available here
+                f.seek(0)
+
+        if hasattr(hashlib, 'file_digest'):  # python >= 3.11, zero-copy
+            return hashlib.file_digest(f, 'md5').hexdigest()
+
+        h = hashlib.md5()
         while True:
             chunk = f.read(chunk_size)
-            if len(chunk):
-                h.update(chunk)
-            else:
+            if not chunk:
                 break
-    return h.hexdigest()
+            h.update(chunk)
+        return h.hexdigest()
 
 
 def split_zip_v2(zipfile: Path, chunk_max_size: int = 500000000, hash_parts: bool = True):
@@ -29,22 +42,49 @@ def split_zip_v2(zipfile: Path, chunk_max_size: int = 500000000, hash_parts: boo
     print(f"splitting {zipfile} into chunks...")
 
     tmp_loc = Path(tempfile.mkdtemp(dir=f"{zipfile.parents[0]}"))
-    fs = Filesplit()
-    fs.split(file=f"{zipfile}", split_size=chunk_max_size, output_dir=str(tmp_loc))
-    df = pd.read_csv(tmp_loc / 'fs_manifest.csv')
+
+    # split and hash in a single pass: each buffer read from the archive
+    # updates the whole-file hash and the current part hash as it is
+    # written back out, so the bytes traverse the disk only once
+    buffer_size = 8 << 20
+    parts = []
+    whole_hash = hashlib.md5()
+    with zipfile.open('rb') as src:
+        part_num = 0
+        while True:
+            part_num += 1
+            part_name = f"{zipfile.stem}_{part_num:04d}{zipfile.suffix}"
+            part_hash = hashlib.md5()
+            written = 0
+            with (tmp_loc / part_name).open('wb') as dst:
+                while written < chunk_max_size:
+                    chunk = src.read(
+                        min(buffer_size, chunk_max_size - written))
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    whole_hash.update(chunk)
+                    part_hash.update(chunk)
+                    written += len(chunk)
+            if written == 0:
+                (tmp_loc / part_name).unlink()
+                break
+            parts.append((part_name, written, part_hash.hexdigest()))
+
     if hash_parts:
-        df['hash'] = df.apply(lambda row: md5sum(
-            (tmp_loc / row['filename'])), axis=1)
-        index: List[ManifestFileIndexItem] = [ManifestFileIndexItem(file_name=x[0], file_size=x[1], file_hash=x[2])
-                                              for x in zip(df['filename'], df['filesize'], df['hash'])]
+        index: List[ManifestFileIndexItem] = [
+            ManifestFileIndexItem(
+                file_name=name, file_size=size, file_hash=part_hash)
+            for name, size, part_hash in parts]
     else:
-        index: List[ManifestFileIndexItem] = [ManifestFileIndexItem(file_name=x[0], file_size=x[1])
-                                              for x in zip(df['filename'], df['filesize'])]
+        index: List[ManifestFileIndexItem] = [
+            ManifestFileIndexItem(file_name=name, file_size=size)
+            for name, size, _ in parts]
 
     return SplitManifest(
         filename=zipfile.name,
         tmp_location=tmp_loc,
-        hash=md5sum(zipfile),
+        hash=whole_hash.hexdigest(),
         index=index,
         hashed_parts=hash_parts
     )
\ No newline at end of file
@@ -1,5 +1,7 @@
 import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from rich import inspect, print
@@ -17,9 +19,26 @@ from .split import split_zip_v2, md5sum
 console = Console()
 
 
+def _submission_id(response):
+    """ Extract the submission id from a creation response """
+    # the server returns the id as a JSON-encoded string; fall back to
+    # stripping quotes if it ever comes back as plain text
+    try:
+        return f"{response.json()}"
+    except ValueError:
+        return response.text.strip('"\'')
+
+
 def multipart_upload(challenge_id: int, zipfile: Path, _token: str, checkpoint: Path):
     print("preparing metadata....")
 
+    # an archive that fits in a single part gains nothing from being
+    # split: skip the extra on-disk copy and re-hashing entirely
+    if not checkpoint.is_file() \
+            and zipfile.stat().st_size <= model.MULTIPART_THRESHOLD:
+        single_part_upload(challenge_id, zipfile, _token)
+        return []
+
     # check for checkpoint
     if checkpoint.is_file():
         file_list = model.UploadManifest.load(checkpoint, retries=model.NB_RETRY_ATTEMPTS)
@@ -50,32 +69,55 @@ def multipart_upload(challenge_id: int, zipfile: Path, _token: str, checkpoint:
             inspect(response.json())
             sys.exit(1)
 
-        submission_id = response.text.replace('"', '').replace("'", "")
+        submission_id = _submission_id(response)
         file_list.metadata = {"submission_id": submission_id}
 
-    with Progress() as progress:
-        task1 = progress.add_task("[red]Uploading parts...", total=len(file_list.man))
+    # the manifest state machine is shared by the upload workers
+    manifest_lock = threading.Lock()
 
-        for item in file_list:
-            file_list.set_waiting(item)
-            progress.update(task1, advance=0.5)
-            file_path = tmp_location / item
-            print(f'uploading : {file_path.name}...')
-            response = submission_upload(
-                challenge_id=challenge_id,
-                submission_id=submission_id,
-                file=file_path,
-                _token=_token
-            )
+    def _upload_part(item):
+        file_path = tmp_location / item
+        print(f'uploading : {file_path.name}...')
+        response = submission_upload(
+            challenge_id=challenge_id,
+            submission_id=submission_id,
+            file=file_path,
+            _token=_token
+        )
 
+        with manifest_lock:
             if response.status_code == 200:
                 print(f'[green]:heavy_check_mark: {file_path}')
                 file_list.set_done(item)
-                progress.update(task1, advance=0.5)
             else:
-                progress.update(task1, advance=-0.5)
                 file_list.set_failed(item)
+        return response.status_code == 200
+
+    with Progress() as progress:
+        task1 = progress.add_task("[red]Uploading parts...", total=len(file_list.man))
 
+        # upload the parts concurrently (network-bound, the GIL is
+        # released in the socket writes), retrying failed parts by rounds
+        # until everything is done or definitely failed
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            while True:
+                with manifest_lock:
+                    pending = [
+                        item for item, status in file_list.man.items()
+                        if status in ('todo', 'waiting')
+                        or status.startswith('retry_')]
+                    for item in pending:
+                        file_list.set_waiting(item)
+                if not pending:
+                    break
+
+                futures = [
+                    executor.submit(_upload_part, item) for item in pending]
+                for future in as_completed(futures):
+                    if future.result():
+                        progress.update(task1, advance=1)
+
+    file_list.flush()
     if file_list.is_complete():
         checkpoint.unlink()
         shutil.rmtree(tmp_location)
@@ -93,7 +135,7 @@ def single_part_upload(challenge_id: int, zipfile: Path, _token: str):
         inspect(response.json())
         sys.exit(1)
 
-    submission_id = response.text.replace('"', '').replace("'", "")
+    submission_id = _submission_id(response)
     print(f'submission id: {submission_id}')
     response = submission_upload(
         challenge_id=challenge_id,